@@ -2,9 +2,22 @@ import os
 import sys
 import json
 import time
+import math
+import uuid
+import fcntl
+import queue
+import atexit
+import signal
+import logging
 import argparse
+import tempfile
+import threading
 import requests
-from typing import Dict, List, Optional, Union, Any
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Union, Any, Callable
 
 
 class VaultClient:
@@ -57,7 +70,7 @@ class VaultClient:
             )
             return True
         except Exception as e:
-            print(f"Error storing project info in Vault: {str(e)}")
+            logger.error(f"Error storing project info in Vault: {str(e)}")
             return False
     
     def get_project_info(self, path_prefix: str, project_name: str) -> Optional[Dict[str, Any]]:
@@ -76,7 +89,7 @@ class VaultClient:
             response = self.client.secrets.kv.v1.read_secret(path=path)
             return response['data'] if response and 'data' in response else None
         except Exception as e:
-            print(f"Error retrieving project info from Vault: {str(e)}")
+            logger.error(f"Error retrieving project info from Vault: {str(e)}")
             return None#!/usr/bin/env python3
 """
 Elastic Cloud Serverless API Project Manager
@@ -86,6 +99,9 @@ This script provides functionality to manage Elastic Cloud Serverless projects v
 - Delete existing projects
 - Update project configurations
 - Reset project credentials
+- Replay search template requests against a project under load
+- Summarize per-phase latencies from the JSONL event log
+- Look up a project's stored endpoints and credentials
 
 The script is designed to be containerized and run in a Kubernetes environment, 
 accepting configuration via environment variables, with HashiCorp Vault integration
@@ -101,6 +117,22 @@ Environment Variables:
     ELASTIC_OPERATION: Operation to perform (create, delete, update)
     ELASTIC_PROJECT_NAME: Name of the project (for creation)
     ELASTIC_PROJECT_ID: ID of the project (for deletion/update)
+    ELASTIC_SCHEDULE: Set to true to pick regions from the ELASTIC_REGIONS pool by observed time-to-ready
+    ELASTIC_PROJECT_COUNT: Number of projects to create in schedule mode
+    
+    # Search load test
+    LOAD_TEST_REQUESTS_FILE: JSONL file of search template parameters
+    ES_URL: Elasticsearch URL of the project under test
+    ES_API_KEY: Elasticsearch API key of the project under test
+    
+    # Results store
+    PROJECT_RESULTS_DIR: Directory of the per-run results store (default: /tmp/project_results)
+        /tmp/project_results.json is still written by create but is deprecated: it holds
+        only the last run on the host. Use --operation lookup --project-name NAME instead.
+    ELASTIC_LOOKUP_REGION: Region of the project to look up (for lookup)
+    
+    # Event log
+    ES3_EVENT_LOG: JSONL event log path (default: /tmp/es3-api-events.jsonl, empty to disable)
     
     # Vault integration
     VAULT_ADDR: HashiCorp Vault address (e.g., https://vault.example.com:8200)
@@ -115,14 +147,191 @@ try:
     VAULT_AVAILABLE = True
 except ImportError:
     VAULT_AVAILABLE = False
-    print("Warning: hvac package not installed. Vault integration will be disabled.")
-    print("To enable Vault integration, install hvac: pip install hvac")
 
 
 # Valid values for API parameters based on Elastic Cloud Serverless API documentation
 VALID_PROJECT_TYPES = ['elasticsearch', 'observability', 'security']
 VALID_OPTIMIZED_FOR = ['general_purpose', 'vector']
 
+# Scheduled creates must not hold a region slot forever
+DEFAULT_READY_TIMEOUT_S = 1800
+
+# Keys whose values are never written to the event log or shown unless asked for
+SECRET_KEYS = {'password', 'api_key', 'encoded', 'token', 'vault_token', 'authorization',
+               'cloud_auth', 'elasticsearch_password', 'llm_api_key'}
+REDACTED = '[REDACTED]'
+
+# Identifies every event written by this invocation
+RUN_ID = uuid.uuid4().hex[:12]
+
+# Fields added to every event (e.g., operation), set once the run is configured
+EVENT_CONTEXT: Dict[str, Any] = {}
+
+logger = logging.getLogger('es3-api')
+
+
+def redact(value: Any) -> Any:
+    """
+    Replace secret values in a (nested) structure
+    
+    Args:
+        value: Dict, list or scalar to redact
+        
+    Returns:
+        Copy of value with secret keys replaced by a placeholder
+    """
+    if isinstance(value, dict):
+        return {k: REDACTED if str(k).lower() in SECRET_KEYS else redact(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+def log_event(event: str, message: Optional[str] = None, level: int = logging.INFO, **fields):
+    """
+    Record a structured event
+    
+    Args:
+        event: Event name (e.g., project.ready)
+        message: Human-readable text for the console; events without one are log-only
+        level: Logging level
+        **fields: Event fields written to the JSONL event log
+    """
+    logger.log(level, message if message is not None else event,
+               extra={'event': event, 'fields': fields, 'human': message is not None})
+
+
+class JsonEventFormatter(logging.Formatter):
+    """
+    Formats records as single-line JSON with secrets redacted
+    
+    Plain warning and error messages (not logged through log_event) are
+    written as log.warning / log.error events carrying the message text.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            'ts': round(record.created, 3),
+            'run_id': RUN_ID,
+            'pid': record.process,
+            'level': record.levelname.lower(),
+            'event': getattr(record, 'event', None) or f"log.{record.levelname.lower()}"
+        }
+        event.update(EVENT_CONTEXT)
+        if hasattr(record, 'fields'):
+            event.update(redact(record.fields))
+        else:
+            event['message'] = record.getMessage()
+        return json.dumps(event, default=str)
+
+
+class BufferedJsonlHandler(logging.Handler):
+    """Appends formatted records to a JSONL file in batches"""
+    
+    def __init__(self, path: str, capacity: int = 100, flush_interval: float = 1.0):
+        """
+        Initialize the handler
+        
+        Args:
+            path: Event log path, opened in append mode so several runs can share it
+            capacity: Number of records buffered before writing (errors flush immediately)
+            flush_interval: Seconds a record may stay buffered, so long polls and
+                concurrent runs see events promptly
+        """
+        # Set before anything can fail: logging.shutdown closes every handler created
+        self.fd = None
+        self.closed = threading.Event()
+        super().__init__()
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.buffer: List[str] = []
+        self.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        threading.Thread(target=self._flush_periodically, daemon=True).start()
+    
+    def _flush_periodically(self):
+        while not self.closed.wait(self.flush_interval):
+            self.flush()
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.buffer.append(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self.buffer) >= self.capacity or record.levelno >= logging.ERROR:
+            self.flush()
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer and self.fd is not None:
+                # One appending write per batch keeps lines from concurrent runs whole
+                data = ''.join(self.buffer).encode()
+                self.buffer = []
+                while data:
+                    data = data[os.write(self.fd, data):]
+        finally:
+            self.release()
+    
+    def close(self):
+        self.closed.set()
+        self.flush()
+        self.acquire()
+        try:
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+        finally:
+            self.release()
+        super().close()
+
+
+def setup_logging(event_log: Optional[str], human_output: bool = True, human_stream: Any = sys.stdout):
+    """
+    Route output through a background thread to the console and the event log
+    
+    Args:
+        event_log: Path of the JSONL event log (None to disable)
+        human_output: Whether to print human-readable messages;
+            warnings and errors still go to stderr when this is off
+        human_stream: Stream for human-readable messages
+    """
+    handlers = []
+    
+    console = logging.StreamHandler(human_stream if human_output else sys.stderr)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    console.addFilter(lambda record: getattr(record, 'human', True))
+    if not human_output:
+        console.setLevel(logging.WARNING)
+    handlers.append(console)
+    
+    if event_log:
+        # An unwritable event log must never block provisioning
+        try:
+            event_handler = BufferedJsonlHandler(event_log)
+        except OSError as e:
+            print(f"Warning: Event log {event_log} disabled: {str(e)}", file=sys.stderr)
+        else:
+            event_handler.setFormatter(JsonEventFormatter())
+            event_handler.addFilter(
+                lambda record: getattr(record, 'event', None) is not None or record.levelno >= logging.WARNING)
+            handlers.append(event_handler)
+    
+    # Callers only enqueue records; formatting and I/O happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    logger.handlers = [QueueHandler(log_queue)]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # atexit doesn't run on SIGTERM (e.g. a Kubernetes pod stop), so exit normally
+    # to drain the queue and flush the event log
+    if signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
 
 def validate_project_type(project_type: str) -> bool:
     """
@@ -135,7 +344,7 @@ def validate_project_type(project_type: str) -> bool:
         True if valid, False otherwise
     """
     if project_type not in VALID_PROJECT_TYPES:
-        print(f"Error: Invalid project type '{project_type}'. Valid values are: {', '.join(VALID_PROJECT_TYPES)}")
+        logger.error(f"Error: Invalid project type '{project_type}'. Valid values are: {', '.join(VALID_PROJECT_TYPES)}")
         return False
     return True
 
@@ -155,11 +364,11 @@ def validate_optimized_for(optimized_for: str, project_type: str) -> bool:
         return True  # Optional parameter
         
     if project_type != 'elasticsearch':
-        print(f"Warning: optimized_for parameter is only applicable to 'elasticsearch' projects, not '{project_type}' projects. Ignoring this parameter.")
+        logger.warning(f"Warning: optimized_for parameter is only applicable to 'elasticsearch' projects, not '{project_type}' projects. Ignoring this parameter.")
         return True
         
     if optimized_for not in VALID_OPTIMIZED_FOR:
-        print(f"Error: Invalid optimized_for value '{optimized_for}'. Valid values are: {', '.join(VALID_OPTIMIZED_FOR)}")
+        logger.error(f"Error: Invalid optimized_for value '{optimized_for}'. Valid values are: {', '.join(VALID_OPTIMIZED_FOR)}")
         return False
     return True
 
@@ -183,6 +392,28 @@ class ElasticCloudClient:
             "Content-Type": "application/json"
         }
     
+    def _request(self, method: str, url: str, api_operation: str,
+                 context: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
+        """
+        Send an API request and record its status and duration in the event log
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            api_operation: Name of the API call (e.g., create_project)
+            context: Extra event fields such as project_id or region
+            **kwargs: Passed through to requests
+            
+        Returns:
+            The API response
+        """
+        kwargs.setdefault('headers', self.headers)
+        start = time.perf_counter()
+        response = requests.request(method, url, **kwargs)
+        log_event('api.request', api_operation=api_operation, status=response.status_code,
+                  duration_ms=round((time.perf_counter() - start) * 1000, 1), **(context or {}))
+        return response
+    
     def create_project(self, 
                        project_type: str, 
                        name: str, 
@@ -215,13 +446,13 @@ class ElasticCloudClient:
         if optimized_for and project_type == "elasticsearch":
             payload["optimized_for"] = optimized_for
         
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self._request('POST', url, 'create_project', {'region': region_id}, json=payload)
         
         if response.status_code == 200 or response.status_code == 201:
             return response.json()
         else:
-            print(f"Error creating project: {response.status_code}")
-            print(response.text)
+            logger.error(f"Error creating project: {response.status_code}")
+            logger.error(response.text)
             raise Exception(f"Failed to create project: {response.text}")
     
     def delete_project(self, project_type: str, project_id: str) -> bool:
@@ -237,13 +468,13 @@ class ElasticCloudClient:
         """
         url = f"{self.BASE_URL}/projects/{project_type}/{project_id}"
         
-        response = requests.delete(url, headers=self.headers)
+        response = self._request('DELETE', url, 'delete_project', {'project_id': project_id})
         
         if response.status_code == 200 or response.status_code == 204:
             return True
         else:
-            print(f"Error deleting project: {response.status_code}")
-            print(response.text)
+            logger.error(f"Error deleting project: {response.status_code}")
+            logger.error(response.text)
             raise Exception(f"Failed to delete project: {response.text}")
     
     def update_project(self, 
@@ -277,13 +508,13 @@ class ElasticCloudClient:
         if if_match:
             headers["If-Match"] = if_match
         
-        response = requests.patch(url, headers=headers, json=payload)
+        response = self._request('PATCH', url, 'update_project', {'project_id': project_id}, headers=headers, json=payload)
         
         if response.status_code == 200:
             return response.json()
         else:
-            print(f"Error updating project: {response.status_code}")
-            print(response.text)
+            logger.error(f"Error updating project: {response.status_code}")
+            logger.error(response.text)
             raise Exception(f"Failed to update project: {response.text}")
     
     def reset_credentials(self, project_type: str, project_id: str) -> Dict[str, Any]:
@@ -299,13 +530,13 @@ class ElasticCloudClient:
         """
         url = f"{self.BASE_URL}/projects/{project_type}/{project_id}/_reset-credentials"
         
-        response = requests.post(url, headers=self.headers)
+        response = self._request('POST', url, 'reset_credentials', {'project_id': project_id})
         
         if response.status_code == 200:
             return response.json()
         else:
-            print(f"Error resetting credentials: {response.status_code}")
-            print(response.text)
+            logger.error(f"Error resetting credentials: {response.status_code}")
+            logger.error(response.text)
             raise Exception(f"Failed to reset credentials: {response.text}")
     
     def get_project(self, project_type: str, project_id: str) -> Dict[str, Any]:
@@ -321,13 +552,13 @@ class ElasticCloudClient:
         """
         url = f"{self.BASE_URL}/projects/{project_type}/{project_id}"
         
-        response = requests.get(url, headers=self.headers)
+        response = self._request('GET', url, 'get_project', {'project_id': project_id})
         
         if response.status_code == 200:
             return response.json()
         else:
-            print(f"Error getting project: {response.status_code}")
-            print(response.text)
+            logger.error(f"Error getting project: {response.status_code}")
+            logger.error(response.text)
             raise Exception(f"Failed to get project: {response.text}")
     
     def get_project_status(self, project_type: str, project_id: str) -> Dict[str, Any]:
@@ -343,13 +574,13 @@ class ElasticCloudClient:
         """
         url = f"{self.BASE_URL}/projects/{project_type}/{project_id}/status"
         
-        response = requests.get(url, headers=self.headers)
+        response = self._request('GET', url, 'get_project_status', {'project_id': project_id})
         
         if response.status_code == 200:
             return response.json()
         else:
-            print(f"Error getting project status: {response.status_code}")
-            print(response.text)
+            logger.error(f"Error getting project status: {response.status_code}")
+            logger.error(response.text)
             raise Exception(f"Failed to get project status: {response.text}")
     
     def list_projects(self, project_type: str) -> List[Dict[str, Any]]:
@@ -364,21 +595,1004 @@ class ElasticCloudClient:
         """
         url = f"{self.BASE_URL}/projects/{project_type}"
         
-        response = requests.get(url, headers=self.headers)
+        response = self._request('GET', url, 'list_projects')
         
         if response.status_code == 200:
             return response.json()
         else:
-            print(f"Error listing projects: {response.status_code}")
-            print(response.text)
+            logger.error(f"Error listing projects: {response.status_code}")
+            logger.error(response.text)
             raise Exception(f"Failed to list projects: {response.text}")
 
 
+def atomic_write_json(path: str, data: Any, mode: int = 0o600):
+    """
+    Write JSON so readers see either the old file or the complete new one
+    
+    Args:
+        path: Destination path
+        data: JSON-serializable data
+        mode: File permissions (results contain credentials)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class ProjectResultsStore:
+    """Per-run store of project results with a compact index for lookups"""
+    
+    def __init__(self, root: str = '/tmp/project_results'):
+        """
+        Initialize the results store
+        
+        Args:
+            root: Directory holding runs/<run_id>.json and index.json
+        """
+        self.root = root
+        self.runs_dir = os.path.join(root, 'runs')
+        self.index_path = os.path.join(root, 'index.json')
+        self.lock_path = os.path.join(root, 'index.lock')
+        os.makedirs(self.runs_dir, mode=0o700, exist_ok=True)
+    
+    @contextmanager
+    def _locked(self):
+        """Hold an exclusive lock on the index across read-modify-write"""
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _read_index(self) -> Dict[str, Any]:
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'runs': {}, 'projects': {}, 'names': {}}
+    
+    def save_run(self, run_id: str, results: Dict[str, Any], metadata: Dict[str, Any]) -> str:
+        """
+        Store the results of a run and add it to the index
+        
+        Args:
+            run_id: Unique ID of the run
+            results: Create results keyed by project ID
+            metadata: Run details (operation, project_type, project_name, ...)
+            
+        Returns:
+            Path of the run file
+        """
+        run_path = os.path.join(self.runs_dir, f"{run_id}.json")
+        atomic_write_json(run_path, dict(metadata, run_id=run_id, results=results))
+        
+        with self._locked():
+            index = self._read_index()
+            index['runs'][run_id] = dict(metadata, projects=list(results),
+                                         regions=sorted({r.get('region_id') for r in results.values()}))
+            for key, result in results.items():
+                if result.get('id'):
+                    index['projects'][result['id']] = {'run_id': run_id, 'key': key}
+                if result.get('name'):
+                    index['names'][result['name']] = run_id
+            atomic_write_json(self.index_path, index)
+        
+        return run_path
+    
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored results of a run
+        
+        Args:
+            run_id: ID of the run
+            
+        Returns:
+            Run data or None if not found
+        """
+        try:
+            with open(os.path.join(self.runs_dir, f"{run_id}.json"), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+    
+    def lookup(self,
+               project_id: Optional[str] = None,
+               project_name: Optional[str] = None,
+               region: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find a project's stored result (endpoints, credentials, ...)
+        
+        The index is replaced atomically, so it is read without taking the lock,
+        and only the matching run file is loaded.
+        
+        Args:
+            project_id: ID of the project
+            project_name: Name of the project (latest run with that name)
+            region: Only return a project created in this region
+            
+        Returns:
+            The project's create result or None if not found
+        """
+        index = self._read_index()
+        
+        if project_id:
+            entry = index['projects'].get(project_id)
+            run_id = entry['run_id'] if entry else None
+        elif project_name:
+            run_id = index['names'].get(project_name)
+        else:
+            return None
+        
+        run = self.get_run(run_id) if run_id else None
+        if not run:
+            return None
+        
+        # A run can hold several projects, so never return one that doesn't match
+        for result in run['results'].values():
+            if project_id and result.get('id') != project_id:
+                continue
+            if project_name and result.get('name') != project_name:
+                continue
+            if region and result.get('region_id') != region:
+                continue
+            return result
+        return None
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with values in milliseconds"""
+
+    def __init__(self, buckets_per_decade: int = 20):
+        """
+        Initialize the histogram
+
+        Args:
+            buckets_per_decade: Number of buckets per power of ten (20 gives ~12% resolution)
+        """
+        self.buckets_per_decade = buckets_per_decade
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms = 0.0
+
+    def _bucket(self, value_ms: float) -> int:
+        return int(math.floor(math.log10(max(value_ms, 0.001)) * self.buckets_per_decade))
+
+    def _upper_bound(self, bucket: int) -> float:
+        return 10 ** ((bucket + 1) / self.buckets_per_decade)
+
+    def record(self, value_ms: float):
+        """Record a single latency value"""
+        bucket = self._bucket(value_ms)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def percentile(self, pct: float) -> float:
+        """
+        Get the latency at a given percentile
+
+        Args:
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, capped at the observed maximum
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(math.ceil(self.count * pct / 100.0)))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._upper_bound(bucket), self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        """Get count, mean, min, max and common percentiles"""
+        return {
+            'count': self.count,
+            'mean': self.total_ms / self.count if self.count else 0.0,
+            'min': self.min_ms or 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'p99.9': self.percentile(99.9),
+            'max': self.max_ms
+        }
+
+    def render(self, width: int = 50) -> List[str]:
+        """Render the non-empty buckets as ASCII bars"""
+        if not self.count:
+            return []
+        peak = max(self.counts.values())
+        lines = []
+        for bucket in sorted(self.counts):
+            bar = '#' * max(1, int(width * self.counts[bucket] / peak))
+            lines.append(f"  <= {self._upper_bound(bucket):10.2f} ms {self.counts[bucket]:8d} {bar}")
+        return lines
+
+
+def profile_stage_timings(profile: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Break a search profile down into per-stage timings
+
+    Shards run in parallel, so each stage reports the slowest shard. Compound
+    retrievers produce one search per sub-retriever; those are reported as
+    separate query stages.
+
+    Args:
+        profile: The "profile" section of a search response
+
+    Returns:
+        Stage name to time in milliseconds
+    """
+    stages: Dict[str, float] = {}
+    for shard in profile.get('shards', []):
+        shard_stages: Dict[str, float] = {}
+        searches = shard.get('searches', [])
+        for i, search in enumerate(searches):
+            suffix = f"[{i}]" if len(searches) > 1 else ""
+            query_ns = sum(q.get('time_in_nanos', 0) for q in search.get('query', []))
+            collector_ns = sum(c.get('time_in_nanos', 0) for c in search.get('collector', []))
+            shard_stages[f"query{suffix}"] = query_ns / 1e6
+            shard_stages[f"rewrite{suffix}"] = search.get('rewrite_time', 0) / 1e6
+            shard_stages[f"collector{suffix}"] = collector_ns / 1e6
+        if 'dfs' in shard:
+            dfs_ns = shard['dfs'].get('statistics', {}).get('time_in_nanos', 0)
+            dfs_ns += sum((k.get('query') or [{}])[0].get('time_in_nanos', 0) for k in shard['dfs'].get('knn', []))
+            shard_stages['dfs'] = dfs_ns / 1e6
+        if 'fetch' in shard:
+            shard_stages['fetch'] = shard['fetch'].get('time_in_nanos', 0) / 1e6
+        for stage, value in shard_stages.items():
+            stages[stage] = max(stages.get(stage, 0.0), value)
+    return stages
+
+
+class SearchLoadGenerator:
+    """Replays rendered search template requests against Elasticsearch"""
+
+    # Upper bound on threads (and connections) used to keep an open-loop schedule
+    MAX_OPEN_LOOP_WORKERS = 1024
+
+    def __init__(self, es_url: str, es_api_key: str, index: str, concurrency: int = 8, timeout: int = 30):
+        """
+        Initialize the load generator
+
+        Args:
+            es_url: Elasticsearch endpoint URL
+            es_api_key: Encoded Elasticsearch API key
+            index: Index (or alias) to search
+            concurrency: Number of worker threads and pooled connections
+            timeout: Per-request timeout in seconds
+        """
+        self.es_url = es_url.rstrip('/')
+        self.index = index
+        self.concurrency = concurrency
+        self.timeout = timeout
+
+        # One pooled session shared by all workers so connections are reused
+        self.session = requests.Session()
+        self._mount_pool(concurrency)
+        self.session.headers.update({
+            "Authorization": f"ApiKey {es_api_key}",
+            "Content-Type": "application/json"
+        })
+
+    def _mount_pool(self, size: int):
+        """Mount a connection pool holding up to size connections"""
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _warm_up(self, bodies: List[Dict[str, Any]], samples: int = 5) -> float:
+        """
+        Send a few untimed searches to open connections and estimate latency
+
+        Args:
+            bodies: Rendered search bodies
+            samples: Number of searches to send
+
+        Returns:
+            Median service time in seconds
+        """
+        times = sorted(self._execute(bodies[i % len(bodies)], time.perf_counter())['service_ms'] / 1000
+                       for i in range(samples))
+        return times[len(times) // 2]
+
+    def render_requests(self,
+                        params_list: List[Dict[str, Any]],
+                        template_source: Optional[str] = None,
+                        template_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Render the search template for each set of parameters
+
+        Rendering is done once up front with the _render/template API, so the
+        timed run only issues the rendered searches.
+
+        Args:
+            params_list: Template parameters, one dict per request
+            template_source: Mustache template source (takes precedence)
+            template_id: ID of a stored search template
+
+        Returns:
+            List of rendered search bodies
+        """
+        url = f"{self.es_url}/_render/template"
+        bodies = []
+        for params in params_list:
+            payload = {"params": params}
+            if template_source:
+                payload["source"] = template_source
+            else:
+                payload["id"] = template_id
+
+            response = self.session.post(url, json=payload, timeout=self.timeout)
+
+            if response.status_code == 200:
+                bodies.append(response.json()['template_output'])
+            else:
+                logger.error(f"Error rendering search template: {response.status_code}")
+                logger.error(response.text)
+                raise Exception(f"Failed to render search template: {response.text}")
+        return bodies
+
+    def _execute(self, body: Dict[str, Any], scheduled: float) -> Dict[str, Any]:
+        """Send one search and measure it against its scheduled start time"""
+        sent = time.perf_counter()
+        result = {'status': None, 'stages': {}}
+        try:
+            response = self.session.post(f"{self.es_url}/{self.index}/_search", json=body, timeout=self.timeout)
+            result['status'] = response.status_code
+            if response.status_code == 200:
+                data = response.json()
+                result['stages']['took'] = float(data.get('took', 0))
+                if 'profile' in data:
+                    result['stages'].update(profile_stage_timings(data['profile']))
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError covers a 200 with a truncated or non-JSON body
+            result['status'] = type(e).__name__
+        done = time.perf_counter()
+
+        # Latency counts from the intended start so queueing behind slow
+        # requests is not hidden (coordinated omission); service time does not
+        result['latency_ms'] = (done - scheduled) * 1000
+        result['service_ms'] = (done - sent) * 1000
+        return result
+
+    def run(self,
+            bodies: List[Dict[str, Any]],
+            total_requests: Optional[int] = None,
+            target_qps: Optional[float] = None,
+            duration: Optional[float] = None,
+            profile: bool = False) -> Dict[str, Any]:
+        """
+        Replay the rendered searches
+
+        With a target QPS the run is open-loop: requests are issued on a fixed
+        schedule regardless of how quickly earlier ones complete. Enough workers
+        are started to keep target QPS x twice the warm-up latency in flight
+        (at least the concurrency). Without a target the run is closed-loop,
+        with each worker sending back to back.
+
+        Args:
+            bodies: Rendered search bodies, replayed round-robin
+            total_requests: Number of searches to send (default: one pass over bodies)
+            target_qps: Request rate for open-loop scheduling
+            duration: Run length in seconds (overrides total_requests)
+            profile: Request search profiles for per-stage timings
+
+        Returns:
+            Report with latency histograms and error counts
+        """
+        if profile:
+            bodies = [dict(body, profile=True) for body in bodies]
+
+        if duration and target_qps:
+            total_requests = int(math.ceil(duration * target_qps))
+        elif not duration:
+            total_requests = total_requests or len(bodies)
+
+        workers = self.concurrency
+        if target_qps:
+            expected_s = self._warm_up(bodies)
+            estimate = min(int(math.ceil(target_qps * expected_s * 2)), self.MAX_OPEN_LOOP_WORKERS)
+            workers = max(self.concurrency, estimate)
+            self._mount_pool(workers)
+
+        results = []
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if target_qps:
+                futures = []
+                interval = 1.0 / target_qps
+                for i in range(total_requests):
+                    scheduled = start + i * interval
+                    delay = scheduled - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    futures.append(executor.submit(self._execute, bodies[i % len(bodies)], scheduled))
+                results = [f.result() for f in futures]
+            else:
+                lock = threading.Lock()
+                counter = [0]
+                deadline = start + duration if duration else None
+
+                def worker():
+                    worker_results = []
+                    while True:
+                        with lock:
+                            i = counter[0]
+                            counter[0] += 1
+                        if deadline is not None:
+                            if time.perf_counter() >= deadline:
+                                break
+                        elif i >= total_requests:
+                            break
+                        worker_results.append(self._execute(bodies[i % len(bodies)], time.perf_counter()))
+                    return worker_results
+
+                for f in [executor.submit(worker) for _ in range(self.concurrency)]:
+                    results.extend(f.result())
+
+        elapsed = time.perf_counter() - start
+        return self._build_report(results, elapsed, target_qps, workers)
+
+    def _build_report(self,
+                      results: List[Dict[str, Any]],
+                      elapsed: float,
+                      target_qps: Optional[float],
+                      workers: int) -> Dict[str, Any]:
+        """Aggregate per-request results into histograms"""
+        latency = LatencyHistogram()
+        service = LatencyHistogram()
+        stages: Dict[str, LatencyHistogram] = {}
+        errors: Dict[str, int] = {}
+
+        for result in results:
+            latency.record(result['latency_ms'])
+            service.record(result['service_ms'])
+            if result['status'] != 200:
+                errors[str(result['status'])] = errors.get(str(result['status']), 0) + 1
+                continue
+            for stage, value in result['stages'].items():
+                stages.setdefault(stage, LatencyHistogram()).record(value)
+
+        return {
+            'requests': len(results),
+            'elapsed_s': elapsed,
+            'achieved_qps': len(results) / elapsed if elapsed else 0.0,
+            'target_qps': target_qps,
+            'workers': workers,
+            'errors': errors,
+            'latency': latency,
+            'service_time': service,
+            'stages': stages
+        }
+
+
+def format_latency_table(rows: List[tuple], label: str = 'stage (ms)') -> List[str]:
+    """
+    Format histogram summaries as a fixed-width table
+
+    Args:
+        rows: (name, LatencyHistogram) pairs
+        label: Heading of the name column
+
+    Returns:
+        Table lines, starting with the header
+    """
+    columns = ['count', 'mean', 'min', 'p50', 'p90', 'p99', 'p99.9', 'max']
+    width = max([len(label)] + [len(name) for name, _ in rows]) + 2
+    lines = [f"{label:<{width}}" + "".join(f"{c:>10}" for c in columns)]
+    for name, histogram in rows:
+        summary = histogram.summary()
+        lines.append(f"{name:<{width}}" + "".join(
+            f"{summary[c]:>10d}" if c == 'count' else f"{summary[c]:>10.2f}" for c in columns))
+    return lines
+
+
+def print_load_report(report: Dict[str, Any]):
+    """Print a load test report and record it in the event log"""
+    mode = f"open-loop at {report['target_qps']} QPS" if report['target_qps'] else "closed-loop"
+    logger.info(f"\nLoad test ({mode}): {report['requests']} requests in {report['elapsed_s']:.1f}s "
+                f"({report['achieved_qps']:.1f} QPS achieved, {report['workers']} workers)")
+
+    # Requests queued behind busy workers, so the server saw less than the target load
+    target_missed = bool(report['target_qps']) and report['achieved_qps'] < 0.9 * report['target_qps']
+    if target_missed:
+        logger.warning(f"Warning: Achieved {report['achieved_qps']:.1f} QPS is below the {report['target_qps']} QPS "
+                       f"target; results understate the load. Raise --concurrency or lower --target-qps.")
+
+    if report['errors']:
+        logger.warning("Errors:")
+        for status, count in sorted(report['errors'].items()):
+            logger.warning(f"  {status}: {count}")
+
+    rows = [('latency', report['latency']), ('service_time', report['service_time'])]
+    rows += sorted(report['stages'].items())
+    logger.info("")
+    for line in format_latency_table(rows):
+        logger.info(line)
+
+    logger.info("\nLatency histogram:")
+    for line in report['latency'].render():
+        logger.info(line)
+    logger.info("=" * 80)
+
+    log_event('load_test.report',
+              requests=report['requests'],
+              elapsed_s=round(report['elapsed_s'], 3),
+              achieved_qps=round(report['achieved_qps'], 2),
+              target_qps=report['target_qps'],
+              target_missed=target_missed,
+              workers=report['workers'],
+              errors=report['errors'],
+              stages={name: histogram.summary() for name, histogram in rows})
+
+
+def load_request_params(path: str) -> List[Dict[str, Any]]:
+    """
+    Load template parameters from a JSONL file
+
+    Each line is either a parameter object or an object with a "params" key.
+
+    Args:
+        path: Path to the JSONL file
+
+    Returns:
+        List of parameter dicts
+    """
+    params_list = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            params_list.append(entry.get('params', entry) if isinstance(entry, dict) else entry)
+    return params_list
+
+
+def load_es_connection(results_dir: str,
+                       project_id: Optional[str] = None,
+                       project_name: Optional[str] = None,
+                       region: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """
+    Look up the Elasticsearch URL and API key of a project in the results store
+
+    Args:
+        results_dir: Directory of the per-run results store
+        project_id: ID of the project
+        project_name: Name of the project
+        region: Region of the project
+
+    Returns:
+        Dict with 'url' and 'api_key' (values are None if the project is not found)
+    """
+    result = None
+    if project_id or project_name:
+        result = ProjectResultsStore(results_dir).lookup(project_id=project_id, project_name=project_name,
+                                                         region=region)
+    if not result:
+        return {'url': None, 'api_key': None}
+    return {
+        'url': result.get('endpoints', {}).get('elasticsearch'),
+        'api_key': result.get('credentials', {}).get('api_key')
+    }
+
+
+def summarize_events(path: str, run_id: Optional[str] = None) -> Dict[str, LatencyHistogram]:
+    """
+    Compute per-phase latency breakdowns from an event log
+
+    Args:
+        path: Path to the JSONL event log
+        run_id: Only include events from this run (optional)
+
+    Returns:
+        Histograms (in milliseconds) keyed by API call, project phase and run operation
+    """
+    histograms: Dict[str, LatencyHistogram] = {}
+    transitions: Dict[tuple, List[tuple]] = {}
+
+    def add(key: str, value_ms: float):
+        histograms.setdefault(key, LatencyHistogram()).record(value_ms)
+
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue  # Skip a truncated last line from an interrupted run
+            if run_id and event.get('run_id') != run_id:
+                continue
+
+            name = event.get('event')
+            if name == 'api.request':
+                add(f"api.{event.get('api_operation')}", event['duration_ms'])
+            elif name == 'project.phase':
+                key = (event.get('run_id'), event.get('project_id'))
+                transitions.setdefault(key, []).append((event['ts'], event.get('phase')))
+            elif name == 'project.ready':
+                key = (event.get('run_id'), event.get('project_id'))
+                transitions.setdefault(key, []).append((event['ts'], None))
+                add('project.time_to_ready', event['time_to_ready_s'] * 1000)
+            elif name == 'run.end':
+                add(f"run.{event.get('operation')}", event['duration_ms'])
+
+    # Time in a phase runs until the next transition; 'initialized' is terminal
+    for phases in transitions.values():
+        phases.sort(key=lambda t: t[0])
+        for (ts, phase), (next_ts, _) in zip(phases, phases[1:]):
+            if phase and phase != 'initialized':
+                add(f"phase.{phase}", (next_ts - ts) * 1000)
+
+    return histograms
+
+
+class ProjectNotReadyError(Exception):
+    """Raised when a created project does not become ready"""
+    
+    def __init__(self, message: str, project_id: str):
+        super().__init__(message)
+        self.project_id = project_id
+        self.deleted = False
+
+
+class RegionScheduler:
+    """Picks regions for new projects from observed provisioning history"""
+    
+    def __init__(self, regions: List[str], max_per_region: int = 2, sample_size: int = 20):
+        """
+        Initialize the scheduler
+        
+        Args:
+            regions: Candidate regions
+            max_per_region: Maximum concurrent creates per region
+            sample_size: Number of recent time-to-ready samples kept per region
+        """
+        self.regions = regions
+        self.max_per_region = max_per_region
+        self.ready_s = {region: [] for region in regions}
+        self.attempts = {region: 0 for region in regions}
+        self.failures = {region: 0 for region in regions}
+        self.in_flight = {region: 0 for region in regions}
+        self.sample_size = sample_size
+        self.condition = threading.Condition()
+    
+    def _add_ready(self, region: str, seconds: float):
+        samples = self.ready_s[region]
+        samples.append(seconds)
+        del samples[:-self.sample_size]
+    
+    def load_history(self, event_log: str, since: float):
+        """
+        Load create outcomes and time-to-ready from the event log
+        
+        An attempt fails if its create_project call returned an error or the
+        project never became ready (project.not_ready). Failed status polls
+        alone don't count, since creates tolerate them while waiting.
+        
+        Args:
+            event_log: Path to the JSONL event log
+            since: Ignore events older than this Unix timestamp
+        """
+        failed_projects = set()
+        
+        with open(event_log, 'r') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get('ts', 0) < since:
+                    continue
+                
+                name = event.get('event')
+                region = event.get('region')
+                if name == 'api.request' and event.get('api_operation') == 'create_project':
+                    if region in self.attempts:
+                        self.attempts[region] += 1
+                        if event.get('status') not in (200, 201):
+                            self.failures[region] += 1
+                elif name == 'project.not_ready':
+                    project_id = event.get('project_id')
+                    if region in self.failures and project_id not in failed_projects:
+                        failed_projects.add(project_id)
+                        self.failures[region] += 1
+                elif name == 'project.ready' and region in self.ready_s:
+                    self._add_ready(region, event['time_to_ready_s'])
+    
+    def score(self, region: str) -> float:
+        """
+        Get the expected time-to-ready of a region (lower is better)
+        
+        The median of recent samples is inflated by the failure rate, since a
+        failed attempt has to be retried. Regions without samples use the
+        median across all regions so they still get tried.
+        
+        Args:
+            region: Region ID
+            
+        Returns:
+            Score in seconds
+        """
+        samples = self.ready_s[region] or [s for r in self.regions for s in self.ready_s[r]] or [1.0]
+        median = sorted(samples)[len(samples) // 2]
+        error_rate = self.failures[region] / self.attempts[region] if self.attempts[region] else 0.0
+        return median / max(1.0 - error_rate, 0.05)
+    
+    def acquire(self) -> str:
+        """
+        Reserve a region for the next create
+        
+        A region at its concurrency cap costs roughly one extra create cycle,
+        so the scheduler waits for a slot there rather than falling back to a
+        region that is more than twice as slow or mostly failing.
+        
+        Returns:
+            Region ID
+        """
+        def cost(region: str) -> tuple:
+            full = self.in_flight[region] >= self.max_per_region
+            return self.score(region) * (2 if full else 1), self.in_flight[region]
+        
+        with self.condition:
+            while True:
+                region = min(self.regions, key=cost)
+                if self.in_flight[region] < self.max_per_region:
+                    self.in_flight[region] += 1
+                    return region
+                self.condition.wait()
+    
+    def release(self, region: str, ready_s: Optional[float] = None, failed: bool = False):
+        """
+        Record the outcome of a create and free its slot
+        
+        Args:
+            region: Region the create ran in
+            ready_s: Time-to-ready in seconds (if it succeeded)
+            failed: Whether the create failed
+        """
+        with self.condition:
+            self.in_flight[region] -= 1
+            self.attempts[region] += 1
+            if failed:
+                self.failures[region] += 1
+            elif ready_s is not None:
+                self._add_ready(region, ready_s)
+            self.condition.notify_all()
+
+
+def run_scheduled_creates(scheduler: RegionScheduler,
+                          project_count: int,
+                          create: Callable[[str, int], Dict[str, Any]],
+                          max_attempts: int = 3) -> tuple:
+    """
+    Create projects concurrently, sending each to the best available region
+    
+    A failed attempt is retried in the then best region unless it left a
+    project behind (a ProjectNotReadyError whose project was not deleted).
+    
+    Args:
+        scheduler: Region scheduler
+        project_count: Number of projects to create
+        create: Callable(region, index) that creates a project and waits for it
+        max_attempts: Attempts per project before giving up
+    
+    Returns:
+        Tuple of ([(region, result)] for created projects in project order,
+        [(index, exception)] for projects that failed)
+    """
+    def create_one(index: int) -> tuple:
+        for attempt in range(1, max_attempts + 1):
+            region = scheduler.acquire()
+            log_event('schedule.assigned', f"Project {index + 1}/{project_count} scheduled in region {region}",
+                      index=index, region=region, attempt=attempt, score_s=round(scheduler.score(region), 1))
+            start = time.perf_counter()
+            try:
+                result = create(region, index)
+            except Exception as e:
+                scheduler.release(region, failed=True)
+                log_event('schedule.failed', f"Warning: Create in {region} failed: {str(e)}", level=logging.WARNING,
+                          index=index, region=region, attempt=attempt, error=str(e))
+                # Retrying would orphan a project that still exists
+                orphaned = isinstance(e, ProjectNotReadyError) and not e.deleted
+                if attempt == max_attempts or orphaned:
+                    raise
+                continue
+            scheduler.release(region, ready_s=time.perf_counter() - start)
+            return region, result
+    
+    max_workers = min(project_count, len(scheduler.regions) * scheduler.max_per_region)
+    created, failures = [], []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(create_one, i) for i in range(project_count)]
+        for index, future in enumerate(futures):
+            try:
+                created.append(future.result())
+            except Exception as e:
+                failures.append((index, e))
+    return created, failures
+
+
+def create_project_in_region(elastic_client: ElasticCloudClient,
+                             vault_client: Optional[VaultClient],
+                             region: str,
+                             project_type: str,
+                             project_name: str,
+                             alias: Optional[str] = None,
+                             optimized_for: Optional[str] = None,
+                             wait_for_ready: bool = False,
+                             vault_path_prefix: str = 'secret/k8s/eden/staging-3',
+                             show_secrets: bool = False,
+                             ready_timeout: Optional[float] = None,
+                             max_poll_errors: int = 5) -> Dict[str, Any]:
+    """
+    Create a project in one region, optionally wait for it, and report it
+    
+    Args:
+        elastic_client: Elastic Cloud API client
+        vault_client: Vault client to store project information in (optional)
+        region: Region ID (e.g., aws-us-east-1)
+        project_type: Type of project (elasticsearch, observability, security)
+        project_name: Project name
+        alias: Custom domain label (optional)
+        optimized_for: Optimization type (for elasticsearch projects)
+        wait_for_ready: Whether to poll the status until the project is initialized
+        vault_path_prefix: Prefix for Vault paths
+        show_secrets: Whether to print the password
+        ready_timeout: Seconds to wait for the project to become ready (None for no limit)
+        max_poll_errors: Consecutive failed status checks before giving up
+    
+    Returns:
+        Response JSON from the create API
+    
+    Raises:
+        ProjectNotReadyError: The project was created but did not become ready
+    """
+    logger.info(f"Creating {project_type} project '{project_name}' in region {region}...")
+    create_start = time.perf_counter()
+    result = elastic_client.create_project(
+        project_type=project_type,
+        name=project_name,
+        region_id=region,
+        alias=alias,
+        optimized_for=optimized_for
+    )
+    
+    project_id = result.get('id')
+    log_event('project.created', project_id=project_id, region=region,
+              duration_ms=round((time.perf_counter() - create_start) * 1000, 1))
+    
+    if project_id and wait_for_ready:
+        logger.info(f"Waiting for project {project_id} to be fully initialized...")
+        last_phase = None
+        poll_errors = 0
+        while True:
+            elapsed = time.perf_counter() - create_start
+            if ready_timeout is not None and elapsed > ready_timeout:
+                log_event('project.not_ready', f"Error: Project {project_id} not ready after {elapsed:.0f}s",
+                          level=logging.ERROR, project_id=project_id, region=region, reason='timeout',
+                          elapsed_s=round(elapsed, 1))
+                raise ProjectNotReadyError(f"Project {project_id} not ready after {elapsed:.0f}s", project_id)
+            
+            # The project already exists, so a failed status check is retried rather than fatal
+            try:
+                status = elastic_client.get_project_status(project_type, project_id)
+            except Exception as e:
+                poll_errors += 1
+                if poll_errors >= max_poll_errors:
+                    log_event('project.not_ready', f"Error: Status checks for project {project_id} keep failing",
+                              level=logging.ERROR, project_id=project_id, region=region, reason='status_errors',
+                              elapsed_s=round(elapsed, 1), error=str(e))
+                    raise ProjectNotReadyError(f"Status checks for project {project_id} failed: {str(e)}", project_id)
+                logger.warning(f"Warning: Status check for project {project_id} failed "
+                               f"({poll_errors}/{max_poll_errors}): {str(e)}")
+                time.sleep(5)
+                continue
+            poll_errors = 0
+            phase = status.get('phase', 'unknown')
+            if phase != last_phase:
+                log_event('project.phase', project_id=project_id, region=region, phase=phase,
+                          elapsed_s=round(time.perf_counter() - create_start, 1))
+                last_phase = phase
+            if phase == 'initialized':
+                log_event('project.ready', f"Project {project_id} is now ready!",
+                          project_id=project_id, region=region,
+                          time_to_ready_s=round(time.perf_counter() - create_start, 1))
+                break
+            logger.info(f"Project status: {phase}. Waiting...")
+            time.sleep(5)
+    
+    logger.info(f"Successfully created project in {region}. Project ID: {project_id}")
+    
+    # Print out important details
+    if 'endpoints' in result:
+        logger.info("\nEndpoints:")
+        for service, url in result['endpoints'].items():
+            logger.info(f"  {service}: {url}")
+    
+    if 'credentials' in result:
+        logger.info("\nCredentials:")
+        logger.info(f"  Username: {result['credentials'].get('username', 'N/A')}")
+        password = result['credentials'].get('password', 'N/A')
+        logger.info(f"  Password: {password if show_secrets else REDACTED}")
+    
+    logger.info(f"\nCloud ID: {result.get('cloud_id', 'N/A')}")
+    logger.info("=" * 80)
+    
+    # Store project information in Vault
+    if vault_client:
+        vault_data = {
+            'id': result.get('id'),
+            'name': result.get('name'),
+            'alias': result.get('alias'),
+            'region_id': result.get('region_id'),
+            'CLOUD_ID': result.get('cloud_id'),
+            'type': result.get('type'),
+            'project_type': project_type
+        }
+        
+        # Add endpoints if available - break them down into individual URLs
+        if 'endpoints' in result:
+            endpoints = result['endpoints']
+            if 'elasticsearch' in endpoints:
+                vault_data['ELASTICSEARCH_URL'] = endpoints['elasticsearch']
+            if 'kibana' in endpoints:
+                vault_data['KIBANA_URL'] = endpoints['kibana']
+        
+        # Add credentials if available - break them down and create CLOUD_AUTH
+        if 'credentials' in result:
+            credentials = result['credentials']
+            username = credentials.get('username')
+            password = credentials.get('password')
+            
+            if username:
+                vault_data['ELASTICSEARCH_USERNAME'] = username
+            if password:
+                vault_data['ELASTICSEARCH_PASSWORD'] = password
+            if username and password:
+                vault_data['CLOUD_AUTH'] = f"{username}:{password}"
+        
+        # Store in Vault
+        success = vault_client.store_project_info(
+            path_prefix=vault_path_prefix,
+            project_name=project_name,
+            project_info=vault_data
+        )
+        
+        if success:
+            log_event('vault.stored',
+                      f"Successfully stored project information in Vault at {vault_path_prefix}/{project_name}/info",
+                      project_id=project_id, path=f"{vault_path_prefix}/{project_name}/info")
+        else:
+            logger.error("Failed to store project information in Vault")
+    return result
+
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Elastic Cloud Serverless API Project Manager')
     
-    parser.add_argument('--operation', choices=['create', 'delete', 'update', 'reset-credentials', 'list'],
+    parser.add_argument('--operation', choices=['create', 'delete', 'update', 'reset-credentials', 'list', 'load-test',
+                                                'summarize-events', 'lookup'],
                         help='Operation to perform')
     
     parser.add_argument('--project-type', choices=VALID_PROJECT_TYPES,
@@ -400,6 +1614,23 @@ def parse_args():
     parser.add_argument('--wait-for-ready', action='store_true', 
                         help='Wait for the project to be fully initialized')
     
+    # Scheduled create parameters
+    parser.add_argument('--schedule', action='store_true',
+                        help='Treat --regions as a candidate pool and send each create to the best region')
+    
+    parser.add_argument('--project-count', type=int, default=1,
+                        help='Number of projects to create (with --schedule)')
+    
+    parser.add_argument('--max-per-region', type=int, default=2,
+                        help='Maximum concurrent creates per region (with --schedule)')
+    
+    parser.add_argument('--history-hours', type=float, default=24,
+                        help='Hours of event log history used to score regions (with --schedule)')
+    
+    parser.add_argument('--ready-timeout', type=float,
+                        help=f'Seconds to wait for a project to become ready '
+                             f'(default: no limit, {DEFAULT_READY_TIMEOUT_S}s with --schedule)')
+    
     # Vault integration parameters
     parser.add_argument('--vault-addr', help='HashiCorp Vault address')
     
@@ -410,14 +1641,160 @@ def parse_args():
     parser.add_argument('--vault-path-prefix', default='secret/k8s/eden/staging-3',
                         help='Prefix for Vault paths')
     
+    # Search load test parameters
+    parser.add_argument('--requests-file', help='JSONL file of search template parameters (for load-test)')
+    
+    parser.add_argument('--search-template', default='/tmp/search-template.mustache',
+                        help='Mustache search template file (falls back to the stored template if missing)')
+    
+    parser.add_argument('--search-template-id', default='properties-search-template',
+                        help='ID of the stored search template')
+    
+    parser.add_argument('--index', default='properties', help='Index to search')
+    
+    parser.add_argument('--es-url',
+                        help='Elasticsearch URL (default: stored endpoint of --project-id/--project-name)')
+    
+    parser.add_argument('--es-api-key',
+                        help='Elasticsearch API key (default: stored API key of --project-id/--project-name, '
+                             'which create does not store, so usually required)')
+    
+    parser.add_argument('--target-qps', type=float,
+                        help='Open-loop request rate; omit for closed-loop at the given concurrency')
+    
+    parser.add_argument('--concurrency', type=int, default=8, help='Worker threads and pooled connections')
+    
+    parser.add_argument('--total-requests', type=int, help='Number of searches to send (default: one per request)')
+    
+    parser.add_argument('--duration', type=float, help='Run length in seconds')
+    
+    parser.add_argument('--profile', action='store_true',
+                        help='Profile searches to report per-stage latencies')
+    
+    # Output and event log parameters
+    parser.add_argument('--event-log', default='/tmp/es3-api-events.jsonl',
+                        help='JSONL event log path (empty string to disable)')
+    
+    parser.add_argument('--quiet', action='store_true',
+                        help='Suppress human-readable output (events are still logged)')
+    
+    parser.add_argument('--show-secrets', action='store_true',
+                        help='Show passwords in human-readable output (never written to the event log)')
+    
+    parser.add_argument('--run-id', help='Only summarize events from this run (for summarize-events)')
+    
+    # Results store parameters
+    parser.add_argument('--results-dir', default='/tmp/project_results',
+                        help='Directory of the per-run project results store')
+    
+    parser.add_argument('--region', help='Region of the project to look up (for lookup)')
+    
     return parser.parse_args()
 
 
+def run_load_test(args, project_id: Optional[str], project_name: Optional[str]):
+    """Render the search template for each request and replay them under load"""
+    requests_file = os.environ.get('LOAD_TEST_REQUESTS_FILE') or args.requests_file
+    if not requests_file:
+        logger.error("Error: Requests file is required for load-test")
+        sys.exit(1)
+    
+    connection = load_es_connection(os.environ.get('PROJECT_RESULTS_DIR') or args.results_dir,
+                                    project_id=project_id, project_name=project_name,
+                                    region=os.environ.get('ELASTIC_LOOKUP_REGION') or args.region)
+    es_url = os.environ.get('ES_URL') or args.es_url or connection['url']
+    es_api_key = os.environ.get('ES_API_KEY') or args.es_api_key or connection['api_key']
+    # Never fall back to whichever project last wrote a shared file
+    if not es_url:
+        logger.error("Error: Elasticsearch URL is required for load-test: pass --es-url, "
+                     "or --project-id/--project-name of a project in the results store")
+        sys.exit(1)
+    if not es_api_key:
+        logger.error("Error: Elasticsearch API key is required for load-test: pass --es-api-key")
+        sys.exit(1)
+    
+    template_source = None
+    if os.path.exists(args.search_template):
+        with open(args.search_template, 'r') as f:
+            template_source = f.read().strip()
+    
+    try:
+        params_list = load_request_params(requests_file)
+        if not params_list:
+            logger.error(f"Error: No requests found in {requests_file}")
+            sys.exit(1)
+        
+        generator = SearchLoadGenerator(es_url, es_api_key, args.index, concurrency=args.concurrency)
+        
+        logger.info(f"Rendering {len(params_list)} search requests...")
+        bodies = generator.render_requests(params_list, template_source, args.search_template_id)
+        
+        logger.info(f"Replaying against {args.index} with concurrency {args.concurrency}...")
+        report = generator.run(
+            bodies,
+            total_requests=args.total_requests,
+            target_qps=args.target_qps,
+            duration=args.duration,
+            profile=args.profile
+        )
+        print_load_report(report)
+    except Exception as e:
+        logger.error(f"Error: {str(e)}")
+        sys.exit(1)
+
+
+def run_summarize_events(args):
+    """Print per-phase latency breakdowns computed from the event log"""
+    event_log = os.environ.get('ES3_EVENT_LOG', args.event_log)
+    if not event_log or not os.path.exists(event_log):
+        logger.error(f"Error: Event log not found: {event_log}")
+        sys.exit(1)
+    
+    histograms = summarize_events(event_log, args.run_id)
+    if not histograms:
+        logger.info(f"No timed events found in {event_log}")
+        return
+    
+    for line in format_latency_table(sorted(histograms.items()), label='phase (ms)'):
+        logger.info(line)
+
+
+def run_lookup(args, project_id: Optional[str], project_name: Optional[str]):
+    """Print a project's stored result as JSON"""
+    if not project_id and not project_name:
+        logger.error("Error: Either Project name or Project ID is required for lookup operation")
+        sys.exit(1)
+    
+    results_dir = os.environ.get('PROJECT_RESULTS_DIR') or args.results_dir
+    region = os.environ.get('ELASTIC_LOOKUP_REGION') or args.region
+    result = ProjectResultsStore(results_dir).lookup(project_id=project_id, project_name=project_name, region=region)
+    if result is None:
+        logger.error(f"Error: No stored results found for project {project_id or project_name}")
+        sys.exit(1)
+    
+    log_event('results.lookup', project_id=result.get('id'), region=result.get('region_id'))
+    
+    # Data output for consumers, so it is written even with --quiet
+    sys.stdout.write(json.dumps(result, indent=2) + '\n')
+
+
 def main():
     """Main function"""
     # Parse arguments from command line
     args = parse_args()
     
+    # Output goes to the console (unless quiet) and the JSONL event log. Lookup, list
+    # and update write JSON to stdout for consumers, so their messages go to stderr
+    event_log = os.environ.get('ES3_EVENT_LOG', args.event_log)
+    data_output = (os.environ.get('ELASTIC_OPERATION') or args.operation) in ['lookup', 'list', 'update']
+    setup_logging(event_log or None, human_output=not args.quiet,
+                  human_stream=sys.stderr if data_output else sys.stdout)
+    show_secrets = args.show_secrets
+    
+    if not VAULT_AVAILABLE:
+        logger.warning("Warning: hvac package not installed. Vault integration will be disabled.")
+        logger.warning("To enable Vault integration, install hvac: pip install hvac")
+    
     # Environment variables have precedence over command line arguments
     api_key = os.environ.get('ELASTIC_API_KEY') or args.api_key
     project_type = os.environ.get('ELASTIC_PROJECT_TYPE') or args.project_type
@@ -428,6 +1805,8 @@ def main():
     alias = os.environ.get('ELASTIC_PROJECT_ALIAS') or args.alias
     optimized_for = os.environ.get('ELASTIC_OPTIMIZED_FOR') or args.optimized_for
     wait_for_ready = os.environ.get('ELASTIC_WAIT_FOR_READY', 'false').lower() == 'true' or args.wait_for_ready
+    schedule = os.environ.get('ELASTIC_SCHEDULE', 'false').lower() == 'true' or args.schedule
+    project_count_str = os.environ.get('ELASTIC_PROJECT_COUNT') or str(args.project_count)
     
     # Vault configuration
     vault_addr = os.environ.get('VAULT_ADDR') or args.vault_addr
@@ -438,17 +1817,32 @@ def main():
     # Check if Vault integration is available and configured
     use_vault = VAULT_AVAILABLE and vault_addr and vault_token
     
-    # Validate parameters
-    if not api_key:
-        print("Error: API key is required")
+    if not operation:
+        logger.error("Error: Operation is required")
         sys.exit(1)
     
-    if not operation:
-        print("Error: Operation is required")
+    EVENT_CONTEXT['operation'] = operation
+    
+    # The load test talks to a project's Elasticsearch endpoint, not the Cloud API
+    if operation == 'load-test':
+        run_load_test(args, project_id, project_name)
+        return
+    
+    if operation == 'summarize-events':
+        run_summarize_events(args)
+        return
+    
+    if operation == 'lookup':
+        run_lookup(args, project_id, project_name)
+        return
+    
+    # Validate parameters
+    if not api_key:
+        logger.error("Error: API key is required")
         sys.exit(1)
     
     if not project_type:
-        print("Error: Project type is required")
+        logger.error("Error: Project type is required")
         sys.exit(1)
     
     # Validate project_type
@@ -460,11 +1854,33 @@ def main():
         sys.exit(1)
     
     if operation == 'create' and (not project_name or not regions_str):
-        print("Error: Project name and regions are required for creation")
+        logger.error("Error: Project name and regions are required for creation")
+        sys.exit(1)
+    
+    try:
+        project_count = int(project_count_str)
+    except ValueError:
+        logger.error(f"Error: Project count must be an integer, got '{project_count_str}'")
+        sys.exit(1)
+    
+    if operation == 'create' and project_count < 1:
+        logger.error("Error: Project count must be at least 1")
+        sys.exit(1)
+    
+    if operation == 'create' and schedule and args.max_per_region < 1:
+        logger.error("Error: --max-per-region must be at least 1")
+        sys.exit(1)
+    
+    if operation == 'create' and schedule and args.history_hours < 0:
+        logger.error("Error: --history-hours must not be negative")
+        sys.exit(1)
+    
+    if operation == 'create' and project_count != 1 and not schedule:
+        logger.error("Error: --project-count requires --schedule")
         sys.exit(1)
     
     if operation in ['delete', 'update', 'reset-credentials'] and not project_name and not project_id:
-        print(f"Error: Either Project name or Project ID is required for {operation} operation")
+        logger.error(f"Error: Either Project name or Project ID is required for {operation} operation")
         sys.exit(1)
     
     # Initialize Elastic client
@@ -474,169 +1890,168 @@ def main():
     vault_client = None
     if use_vault:
         try:
-            print(f"Initializing Vault client with address: {vault_addr}")
+            logger.info(f"Initializing Vault client with address: {vault_addr}")
             vault_client = VaultClient(vault_addr, vault_token, vault_namespace)
-            print("Successfully connected to Vault")
+            logger.info("Successfully connected to Vault")
         except Exception as e:
-            print(f"Warning: Failed to initialize Vault client: {str(e)}")
-            print("Continuing without Vault integration...")
+            logger.warning(f"Warning: Failed to initialize Vault client: {str(e)}")
+            logger.info("Continuing without Vault integration...")
             use_vault = False
     
     # Parse regions
     regions = regions_str.split(',') if regions_str else []
     
+    log_event('run.start', operation=operation, project_type=project_type,
+              project_name=project_name, project_id=project_id, regions=regions)
+    run_start = time.perf_counter()
+    
     # Perform the requested operation
     try:
         if operation == 'create':
             if not regions:
-                print("Error: At least one region is required for creation")
+                logger.error("Error: At least one region is required for creation")
                 sys.exit(1)
                 
-            # Create a project in each specified region
             results = {}
-            for region in regions:
-                print(f"Creating {project_type} project '{project_name}' in region {region}...")
-                result = elastic_client.create_project(
-                    project_type=project_type,
-                    name=project_name,
-                    region_id=region,
-                    alias=alias,
-                    optimized_for=optimized_for
-                )
-                
-                project_id = result.get('id')
-                if project_id and wait_for_ready:
-                    print(f"Waiting for project {project_id} to be fully initialized...")
-                    while True:
-                        status = elastic_client.get_project_status(project_type, project_id)
-                        if status.get('phase') == 'initialized':
-                            print(f"Project {project_id} is now ready!")
-                            break
-                        print(f"Project status: {status.get('phase', 'unknown')}. Waiting...")
-                        time.sleep(5)
-                
-                results[region] = result
-                print(f"Successfully created project in {region}. Project ID: {project_id}")
+            if schedule:
+                # Spread project_count creates over the region pool by observed time-to-ready
+                scheduler = RegionScheduler(regions, max_per_region=args.max_per_region)
+                event_log = os.environ.get('ES3_EVENT_LOG', args.event_log)
+                if event_log and os.path.exists(event_log):
+                    scheduler.load_history(event_log, since=time.time() - args.history_hours * 3600)
                 
-                # Print out important details
-                if 'endpoints' in result:
-                    print("\nEndpoints:")
-                    for service, url in result['endpoints'].items():
-                        print(f"  {service}: {url}")
+                logger.info(f"Scheduling {project_count} projects over {len(regions)} regions:")
+                for region in regions:
+                    logger.info(f"  {region}: expected time-to-ready {scheduler.score(region):.0f}s "
+                                f"({len(scheduler.ready_s[region])} samples, "
+                                f"{scheduler.failures[region]}/{scheduler.attempts[region]} failed)")
                 
-                if 'credentials' in result:
-                    print("\nCredentials:")
-                    print(f"  Username: {result['credentials'].get('username', 'N/A')}")
-                    print(f"  Password: {result['credentials'].get('password', 'N/A')}")
+                # Time-to-ready is what the scheduler learns from, so always wait
+                ready_timeout = args.ready_timeout or DEFAULT_READY_TIMEOUT_S
                 
-                print(f"\nCloud ID: {result.get('cloud_id', 'N/A')}")
-                print("=" * 80)
+                def create(region: str, index: int) -> Dict[str, Any]:
+                    # Names and aliases must be unique per project
+                    suffix = "" if project_count == 1 else f"-{index + 1}"
+                    try:
+                        return create_project_in_region(
+                            elastic_client, vault_client, region, project_type, f"{project_name}{suffix}",
+                            alias=f"{alias}{suffix}" if alias else None,
+                            optimized_for=optimized_for,
+                            wait_for_ready=True,
+                            vault_path_prefix=vault_path_prefix,
+                            show_secrets=show_secrets,
+                            ready_timeout=ready_timeout
+                        )
+                    except ProjectNotReadyError as e:
+                        # Delete the unready project so a retry elsewhere doesn't orphan it
+                        try:
+                            elastic_client.delete_project(project_type, e.project_id)
+                            e.deleted = True
+                            log_event('project.deleted', f"Deleted project {e.project_id} that did not become ready",
+                                      project_id=e.project_id, region=region)
+                        except Exception as delete_error:
+                            logger.error(f"Error: Failed to delete project {e.project_id}: {str(delete_error)}")
+                        raise
                 
-                # Store project information in Vault
-                if vault_client:
-                    vault_data = {
-                        'id': result.get('id'),
-                        'name': result.get('name'),
-                        'alias': result.get('alias'),
-                        'region_id': result.get('region_id'),
-                        'CLOUD_ID': result.get('cloud_id'),
-                        'type': result.get('type'),
-                        'project_type': project_type
-                    }
-                    
-                    # Add endpoints if available - break them down into individual URLs
-                    if 'endpoints' in result:
-                        endpoints = result['endpoints']
-                        if 'elasticsearch' in endpoints:
-                            vault_data['ELASTICSEARCH_URL'] = endpoints['elasticsearch']
-                        if 'kibana' in endpoints:
-                            vault_data['KIBANA_URL'] = endpoints['kibana']
-                    
-                    # Add credentials if available - break them down and create CLOUD_AUTH
-                    if 'credentials' in result:
-                        credentials = result['credentials']
-                        username = credentials.get('username')
-                        password = credentials.get('password')
-                        
-                        if username:
-                            vault_data['ELASTICSEARCH_USERNAME'] = username
-                        if password:
-                            vault_data['ELASTICSEARCH_PASSWORD'] = password
-                        if username and password:
-                            vault_data['CLOUD_AUTH'] = f"{username}:{password}"
-                    
-                    # Store in Vault
-                    success = vault_client.store_project_info(
-                        path_prefix=vault_path_prefix,
-                        project_name=project_name,
-                        project_info=vault_data
+                created, failures = run_scheduled_creates(scheduler, project_count, create)
+                for region, result in created:
+                    result.setdefault('region_id', region)
+                    results[result.get('id') or result.get('name')] = result
+            else:
+                # Create a project in each specified region
+                for region in regions:
+                    result = create_project_in_region(
+                        elastic_client, vault_client, region, project_type, project_name,
+                        alias=alias,
+                        optimized_for=optimized_for,
+                        wait_for_ready=wait_for_ready,
+                        vault_path_prefix=vault_path_prefix,
+                        show_secrets=show_secrets,
+                        ready_timeout=args.ready_timeout
                     )
-                    
-                    if success:
-                        print(f"Successfully stored project information in Vault at {vault_path_prefix}/{project_name}/info")
-                    else:
-                        print("Failed to store project information in Vault")
+                    result.setdefault('region_id', region)
+                    results[result.get('id') or result.get('name')] = result
+                failures = []
             
-            # Write results to a file that could be used by another process
-            with open('/tmp/project_results.json', 'w') as f:
-                json.dump(results, f, indent=2)
+            # Store results per run, keyed by project ID, so concurrent runs on one host
+            # don't clobber each other.
+            # Projects created before a scheduled failure are persisted before it is raised
+            if results:
+                results_dir = os.environ.get('PROJECT_RESULTS_DIR') or args.results_dir
+                run_path = ProjectResultsStore(results_dir).save_run(RUN_ID, results, {
+                    'created_at': time.time(),
+                    'operation': operation,
+                    'project_type': project_type,
+                    'project_name': project_name
+                })
+                
+                # Deprecated: the single-run file is shared by every run on the host, so the
+                # last writer wins. Kept for existing scripts; use --operation lookup instead
+                atomic_write_json('/tmp/project_results.json', results, mode=0o644)
+                log_event('results.written', f"Results stored in {run_path} (run {RUN_ID})",
+                          path=run_path, run_id=RUN_ID, projects=list(results))
+            
+            if failures:
+                raise Exception(f"{len(failures)} of {project_count} projects failed: " +
+                                "; ".join(f"project {index + 1}: {str(e)}" for index, e in failures))
             
         elif operation == 'delete':
             # If project_id is not provided but project_name is, try to get project_id from Vault
             if not project_id and project_name and vault_client:
-                print(f"Project ID not provided, attempting to retrieve from Vault...")
+                logger.info(f"Project ID not provided, attempting to retrieve from Vault...")
                 vault_info = vault_client.get_project_info(vault_path_prefix, project_name)
                 
                 if vault_info and 'id' in vault_info:
                     project_id = vault_info['id']
-                    print(f"Found project ID in Vault: {project_id}")
+                    logger.info(f"Found project ID in Vault: {project_id}")
                     
                     # Also get project_type from Vault if not provided
                     if (not project_type or project_type == "elasticsearch") and 'project_type' in vault_info:
                         project_type = vault_info['project_type']
-                        print(f"Using project type from Vault: {project_type}")
+                        logger.info(f"Using project type from Vault: {project_type}")
                 else:
-                    print("Could not find project information in Vault")
+                    logger.error("Could not find project information in Vault")
             
             if not project_id:
-                print("Error: Project ID is required for deletion")
+                logger.error("Error: Project ID is required for deletion")
                 sys.exit(1)
                 
-            print(f"Deleting {project_type} project {project_id}...")
+            logger.info(f"Deleting {project_type} project {project_id}...")
             result = elastic_client.delete_project(project_type, project_id)
             if result:
-                print(f"Successfully deleted project {project_id}")
+                log_event('project.deleted', f"Successfully deleted project {project_id}", project_id=project_id)
             
         elif operation == 'update':
             # If project_id is not provided but project_name is, try to get project_id from Vault
             if not project_id and project_name and vault_client:
-                print(f"Project ID not provided, attempting to retrieve from Vault...")
+                logger.info(f"Project ID not provided, attempting to retrieve from Vault...")
                 vault_info = vault_client.get_project_info(vault_path_prefix, project_name)
                 
                 if vault_info and 'id' in vault_info:
                     project_id = vault_info['id']
-                    print(f"Found project ID in Vault: {project_id}")
+                    logger.info(f"Found project ID in Vault: {project_id}")
                     
                     # Also get project_type from Vault if not provided
                     if (not project_type or project_type == "elasticsearch") and 'project_type' in vault_info:
                         project_type = vault_info['project_type']
-                        print(f"Using project type from Vault: {project_type}")
+                        logger.info(f"Using project type from Vault: {project_type}")
                 else:
-                    print("Could not find project information in Vault")
+                    logger.error("Could not find project information in Vault")
             
             if not project_id:
-                print("Error: Project ID is required for update")
+                logger.error("Error: Project ID is required for update")
                 sys.exit(1)
                 
-            print(f"Updating {project_type} project {project_id}...")
+            logger.info(f"Updating {project_type} project {project_id}...")
             result = elastic_client.update_project(
                 project_type=project_type,
                 project_id=project_id,
                 name=project_name,
                 alias=alias
             )
-            print(f"Successfully updated project {project_id}")
-            print(json.dumps(result, indent=2))
+            log_event('project.updated', f"Successfully updated project {project_id}", project_id=project_id)
+            # Data output for consumers, so it is written even with --quiet
+            sys.stdout.write(json.dumps(result, indent=2) + '\n')
             
             # Update Vault information if configured
             if vault_client and project_name:
@@ -658,42 +2073,43 @@ def main():
                     )
                     
                     if success:
-                        print(f"Successfully updated project information in Vault")
+                        logger.info(f"Successfully updated project information in Vault")
                     else:
-                        print("Failed to update project information in Vault")
+                        logger.error("Failed to update project information in Vault")
                 else:
-                    print(f"No existing project information found in Vault for {project_name}")
+                    logger.info(f"No existing project information found in Vault for {project_name}")
             
         elif operation == 'reset-credentials':
             # If project_id is not provided but project_name is, try to get project_id from Vault
             if not project_id and project_name and vault_client:
-                print(f"Project ID not provided, attempting to retrieve from Vault...")
+                logger.info(f"Project ID not provided, attempting to retrieve from Vault...")
                 vault_info = vault_client.get_project_info(vault_path_prefix, project_name)
                 
                 if vault_info and 'id' in vault_info:
                     project_id = vault_info['id']
-                    print(f"Found project ID in Vault: {project_id}")
+                    logger.info(f"Found project ID in Vault: {project_id}")
                     
                     # Also get project_type from Vault if not provided
                     if (not project_type or project_type == "elasticsearch") and 'project_type' in vault_info:
                         project_type = vault_info['project_type']
-                        print(f"Using project type from Vault: {project_type}")
+                        logger.info(f"Using project type from Vault: {project_type}")
                 else:
-                    print("Could not find project information in Vault")
+                    logger.error("Could not find project information in Vault")
             
             if not project_id:
-                print("Error: Project ID is required for resetting credentials")
+                logger.error("Error: Project ID is required for resetting credentials")
                 sys.exit(1)
                 
-            print(f"Resetting credentials for {project_type} project {project_id}...")
+            logger.info(f"Resetting credentials for {project_type} project {project_id}...")
             result = elastic_client.reset_credentials(project_type, project_id)
-            print(f"Successfully reset credentials for project {project_id}")
+            log_event('project.credentials_reset', f"Successfully reset credentials for project {project_id}",
+                      project_id=project_id)
             
             # The reset-credentials API returns credentials directly in the response
             if 'username' in result and 'password' in result:
-                print("\nNew Credentials:")
-                print(f"  Username: {result.get('username', 'N/A')}")
-                print(f"  Password: {result.get('password', 'N/A')}")
+                logger.info("\nNew Credentials:")
+                logger.info(f"  Username: {result.get('username', 'N/A')}")
+                logger.info(f"  Password: {result.get('password', 'N/A') if show_secrets else REDACTED}")
             
             # Update credentials in Vault if configured
             if vault_client and project_name and ('username' in result or 'password' in result):
@@ -720,23 +2136,28 @@ def main():
                     )
                     
                     if success:
-                        print(f"Successfully updated credentials in Vault")
+                        logger.info(f"Successfully updated credentials in Vault")
                     else:
-                        print("Failed to update credentials in Vault")
+                        logger.error("Failed to update credentials in Vault")
                 else:
-                    print(f"No existing project information found in Vault for {project_name}")
+                    logger.info(f"No existing project information found in Vault for {project_name}")
             
         elif operation == 'list':
-            print(f"Listing all {project_type} projects...")
+            logger.info(f"Listing all {project_type} projects...")
             result = elastic_client.list_projects(project_type)
-            print(json.dumps(result, indent=2))
+            # Data output for consumers, so it is written even with --quiet
+            sys.stdout.write(json.dumps(result, indent=2) + '\n')
             
         else:
-            print(f"Unknown operation: {operation}")
+            logger.error(f"Unknown operation: {operation}")
             sys.exit(1)
+        
+        log_event('run.end', operation=operation, status='ok',
+                  duration_ms=round((time.perf_counter() - run_start) * 1000, 1))
             
     except Exception as e:
-        print(f"Error: {str(e)}")
+        log_event('run.end', f"Error: {str(e)}", level=logging.ERROR, operation=operation, status='failed',
+                  error=str(e), duration_ms=round((time.perf_counter() - run_start) * 1000, 1))
         sys.exit(1)
 
 
@@ -13,13 +13,17 @@ done
 echo "Project type: $PROJECT_TYPE"
 echo "Regions: $REGIONS"
 
+# The name is used again to look up this project's results
+PROJECT_NAME=$INSTRUQT_TRACK_SLUG-$INSTRUQT_PARTICIPANT_ID-`date '+%s'`
+echo "Project name: $PROJECT_NAME"
+
 case "$PROJECT_TYPE" in
     "observability"|"security")
       python3 bin/es3-api.py \
         --operation create \
         --project-type $PROJECT_TYPE \
         --regions $REGIONS \
-        --project-name $INSTRUQT_TRACK_SLUG-$INSTRUQT_PARTICIPANT_ID-`date '+%s'` \
+        --project-name "$PROJECT_NAME" \
         --api-key "$ESS_CLOUD_API_KEY" \
         --wait-for-ready
         ;;
@@ -31,7 +35,7 @@ case "$PROJECT_TYPE" in
         --project-type $PROJECT_TYPE \
         --optimized-for $OPTIMIZED_FOR \
         --regions $REGIONS \
-        --project-name $INSTRUQT_TRACK_SLUG-$INSTRUQT_PARTICIPANT_ID-`date '+%s'` \
+        --project-name "$PROJECT_NAME" \
         --api-key "$ESS_CLOUD_API_KEY" \
         --wait-for-ready
         ;;
@@ -41,39 +45,25 @@ case "$PROJECT_TYPE" in
         ;;
 esac
 
-timeout=20
-counter=0
+# Look up this project by name; /tmp/project_results.json is shared by every run on the host
+PROJECT_JSON=$(python3 bin/es3-api.py --operation lookup --project-name "$PROJECT_NAME")
+echo "Project results content:"
+echo "$PROJECT_JSON" | jq 'del(.credentials)'
 
-while [ $counter -lt $timeout ]; do
-    if [ -f "/tmp/project_results.json" ]; then
-        echo "File found, continuing..."
-        echo "Project results content:"
-        cat /tmp/project_results.json
-        echo ""
-        break
-    fi
-    
-    echo "Waiting for file /tmp/project_results.json... ($((counter + 1))/$timeout seconds)"
-    sleep 1
-    counter=$((counter + 1))
-done
-
-# Check if we timed out
-if [ $counter -eq $timeout ]; then
-    echo "Timeout: File /tmp/project_results.json not found after $timeout seconds"
-    exit 1
-fi
+# The API key and LLM steps below, and the workshop scripts, still read the legacy file,
+# so point it at this project
+echo "$PROJECT_JSON" | jq '{(.id): .}' > /tmp/project_results.json
 
-export KIBANA_URL=`jq -r 'to_entries[0].value.endpoints.kibana' /tmp/project_results.json`
-export ELASTICSEARCH_PASSWORD=`jq -r 'to_entries[0].value.credentials.password' /tmp/project_results.json`
-export ES_URL=`jq -r 'to_entries[0].value.endpoints.elasticsearch' /tmp/project_results.json`
+export KIBANA_URL=`echo "$PROJECT_JSON" | jq -r '.endpoints.kibana'`
+export ELASTICSEARCH_PASSWORD=`echo "$PROJECT_JSON" | jq -r '.credentials.password'`
+export ES_URL=`echo "$PROJECT_JSON" | jq -r '.endpoints.elasticsearch'`
 
 # Extract values from project results JSON
-ES_KIBANA_URL_VALUE=$(jq -r 'to_entries[0].value.endpoints.kibana' /tmp/project_results.json)
-ES_USERNAME_VALUE=$(jq -r 'to_entries[0].value.credentials.username' /tmp/project_results.json)
-ES_PASSWORD_VALUE=$(jq -r 'to_entries[0].value.credentials.password' /tmp/project_results.json)
-ES_DEPLOYMENT_ID_VALUE=$(jq -r 'to_entries[0].value.id' /tmp/project_results.json)
-ES_URL_VALUE=$(jq -r 'to_entries[0].value.endpoints.elasticsearch' /tmp/project_results.json)
+ES_KIBANA_URL_VALUE=$(echo "$PROJECT_JSON" | jq -r '.endpoints.kibana')
+ES_USERNAME_VALUE=$(echo "$PROJECT_JSON" | jq -r '.credentials.username')
+ES_PASSWORD_VALUE=$(echo "$PROJECT_JSON" | jq -r '.credentials.password')
+ES_DEPLOYMENT_ID_VALUE=$(echo "$PROJECT_JSON" | jq -r '.id')
+ES_URL_VALUE=$(echo "$PROJECT_JSON" | jq -r '.endpoints.elasticsearch')
 
 # Set agent variables
 agent variable set ES_KIBANA_URL "$ES_KIBANA_URL_VALUE"
@@ -151,8 +141,8 @@ fail_message() {
   exit 1
 }
 
-ES_USERNAME=$(jq -r 'to_entries[0].value.credentials.username' /tmp/project_results.json)
-ES_PASSWORD=$(jq -r 'to_entries[0].value.credentials.password' /tmp/project_results.json)
+ES_USERNAME=$(echo "$PROJECT_JSON" | jq -r '.credentials.username')
+ES_PASSWORD=$(echo "$PROJECT_JSON" | jq -r '.credentials.password')
 
 # Create API key with specified privileges
 /tmp/venv/bin/python <<EOF